@@ -12,6 +12,7 @@ import os
 import json
 import base64
 import hashlib
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 from dataclasses import dataclass, asdict
@@ -31,6 +32,33 @@ try:
 except ImportError:
     ED25519_AVAILABLE = False
 
+# Per-thread verifier contexts, keyed by algorithm name. Verification only
+# needs the public key passed to verify(), so one context can be reused
+# for every signature checked on that thread.
+_verifiers = threading.local()
+
+
+def get_verifier(algorithm: str) -> "oqs.Signature":
+    """
+    Return this thread's cached oqs.Signature context for algorithm.
+    
+    Creating a context runs liboqs algorithm setup, so it is done once
+    per thread rather than once per verification.
+    
+    Args:
+        algorithm: liboqs signature mechanism name (e.g. "ML-DSA-87")
+        
+    Returns:
+        Reusable oqs.Signature instance
+    """
+    cache = getattr(_verifiers, "by_algorithm", None)
+    if cache is None:
+        cache = _verifiers.by_algorithm = {}
+    verifier = cache.get(algorithm)
+    if verifier is None:
+        verifier = cache[algorithm] = oqs.Signature(algorithm)
+    return verifier
+
 
 @dataclass
 class AgentIdentity:
@@ -387,8 +415,8 @@ class IdentityManager:
             sig_bytes = base64.b64decode(signature)
             pubkey_bytes = base64.b64decode(public_key)
             
-            with oqs.Signature(self.ALGORITHM) as verifier:
-                return verifier.verify(message, sig_bytes, pubkey_bytes)
+            verifier = get_verifier(self.ALGORITHM)
+            return verifier.verify(message, sig_bytes, pubkey_bytes)
         except Exception as e:
             print(f"Signature verification failed: {e}")
             return False
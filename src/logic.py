@@ -6,16 +6,21 @@ Contains all command implementations and business logic.
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from .core import MemoryShard, MoltMagnet, create_shard_from_file, DEFAULT_TRACKERS
-from .network import SynapseNode
-from . import setup_identity
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # Configure logging
@@ -26,36 +31,112 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Render full tracebacks for command failures (--verbose or env var)
+_DEBUG = os.environ.get("SYNAPSE_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Emit single-line JSON instead of pretty-printing (--compact or env var)
+_COMPACT_OUTPUT = os.environ.get("SYNAPSE_JSON_COMPACT", "").lower() in ("1", "true", "yes")
+
+
 def output_json(data: Dict[str, Any]):
     """Output data as JSON to stdout."""
-    print(json.dumps(data, indent=2))
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(data) if _COMPACT_OUTPUT else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    elif _COMPACT_OUTPUT:
+        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    else:
+        encoded = json.dumps(data, indent=2).encode("utf-8")
+    
+    # Single pre-encoded write, bypassing the text layer
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encoded + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def load_json_file(path) -> Any:
+    """Read and decode a JSON file, using orjson when available."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
+def load_shard_metadata(metadata_path) -> "MemoryShard":
+    """
+    Load a MemoryShard from its .meta.json file.
+    
+    Raises:
+        FileNotFoundError: If the metadata file does not exist
+    """
+    from .core import MemoryShard
+    
+    return MemoryShard.from_dict(load_json_file(metadata_path))
+
+
+# Process-lifetime SynapseNode instances, keyed by data directory
+_NODES: Dict[str, Any] = {}
+_NODES_LOCK = threading.Lock()
+
+
+def _get_node(data_dir: Optional[str] = None):
+    """Return the shared SynapseNode for data_dir, creating it on first use."""
+    from .network import SynapseNode
+    
+    key = data_dir or ""
+    # Held across construction so concurrent callers never build two nodes
+    # (each would start its own BitTorrent session on the listen port)
+    with _NODES_LOCK:
+        node = _NODES.get(key)
+        if node is None:
+            node = SynapseNode(data_dir=data_dir) if data_dir else SynapseNode()
+            _NODES[key] = node
+    return node
 
-def output_error(message: str, code: int = 1):
-    """Output error message and exit."""
-    output_json({
+
+def split_csv(value: str) -> List[str]:
+    """Split a comma-separated CLI value into stripped, non-empty items."""
+    return list(filter(None, map(str.strip, value.split(','))))
+
+
+def output_error(message: str, code: int = 1, error_type: Optional[str] = None, **details: Any):
+    """Output error message (plus any extra detail fields) and exit."""
+    error = {
         "status": "error",
         "error": message,
         "code": code
-    })
+    }
+    if error_type:
+        error["error_type"] = error_type
+    error.update(details)
+    output_json(error)
     sys.exit(code)
 
 
+def log_exception(message: str, exc: BaseException):
+    """Log a command failure; the full traceback is only rendered in debug mode."""
+    if _DEBUG:
+        logger.exception(message)
+    else:
+        logger.error("%s: %s: %s", message, type(exc).__name__, exc)
+
+
 def cmd_create_shard(args):
     """Create a memory shard from a vector database file."""
     try:
+        from .core import create_shard_from_file
+        
         # Parse tags if provided
         tags = []
         if args.tags:
-            tags = [t.strip() for t in args.tags.split(',') if t.strip()]
+            tags = split_csv(args.tags)
         
-        # Check if source file exists
-        if not Path(args.source).exists():
+        # Check if source file exists (single stat, no separate exists() probe)
+        try:
+            Path(args.source).stat()
+        except FileNotFoundError:
             output_error(f"Source file not found: {args.source}")
         
-        # Get file info
-        file_size = Path(args.source).stat().st_size
-        
         # Create shard (with placeholder values - in production, these would be extracted)
         shard = create_shard_from_file(
             file_path=args.source,
@@ -77,32 +158,29 @@ def cmd_create_shard(args):
         })
     
     except Exception as e:
-        logger.exception("Failed to create shard")
-        output_error(str(e))
+        log_exception("Failed to create shard", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_generate_magnet(args):
     """Generate a magnet link from a memory shard."""
     try:
+        from .core import DEFAULT_TRACKERS
+        
         # Load shard metadata
         metadata_path = f"{args.shard}.meta.json"
-        if not Path(metadata_path).exists():
+        try:
+            shard = load_shard_metadata(metadata_path)
+        except FileNotFoundError:
             output_error(f"Shard metadata not found: {metadata_path}")
         
-        with open(metadata_path) as f:
-            shard_data = json.load(f)
-        
-        shard = MemoryShard.from_dict(shard_data)
-        
-        # Parse trackers if provided
-        trackers = DEFAULT_TRACKERS.copy()
-        if args.trackers:
-            custom_trackers = [t.strip() for t in args.trackers.split(',') if t.strip()]
-            if custom_trackers:
-                trackers = custom_trackers
+        # Parse trackers if provided (announce_shard never mutates the list,
+        # so the shared defaults are passed without copying)
+        custom_trackers = split_csv(args.trackers) if args.trackers else []
+        trackers = custom_trackers or DEFAULT_TRACKERS
         
         # Initialize node and announce
-        node = SynapseNode()
+        node = _get_node()
         magnet = node.announce_shard(shard, trackers)
         
         output_json({
@@ -114,8 +192,8 @@ def cmd_generate_magnet(args):
         })
     
     except Exception as e:
-        logger.exception("Failed to generate magnet")
-        output_error(str(e))
+        log_exception("Failed to generate magnet", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_search(args):
@@ -153,6 +231,9 @@ def cmd_search(args):
         
         results = data.get("results", [])
         
+        # The tracker ranks results itself; only enforce the requested limit
+        results = results[:args.limit]
+        
         output_json({
             "status": "success",
             "query": args.query,
@@ -162,97 +243,141 @@ def cmd_search(args):
         })
     
     except ImportError as e:
-        logger.exception("Missing dependency")
+        log_exception("Missing dependency", e)
         output_error(f"Missing required module: {e}. Install with: uv pip install requests sentence-transformers")
     except requests.exceptions.RequestException as e:
-        logger.exception("Failed to connect to tracker")
+        log_exception("Failed to connect to tracker", e)
         output_error(f"Tracker connection failed: {e}")
     except Exception as e:
-        logger.exception("Failed to search")
-        output_error(str(e))
+        log_exception("Failed to search", e)
+        output_error(str(e), error_type=type(e).__name__)
+
+
+def _download_one(node, magnet_uri: str, output_dir: str) -> Dict[str, Any]:
+    """Download a single magnet link through node and write its shard metadata."""
+    from .core import MemoryShard, MoltMagnet
+    
+    # Parse magnet link
+    magnet = MoltMagnet.from_magnet_uri(magnet_uri)
+    
+    logger.info(f"Downloading shard: {magnet.display_name}")
+    logger.info(f"Info hash: {magnet.info_hash}")
+    logger.info(f"Trackers: {len(magnet.trackers)}")
+    
+    # Download using BitTorrent or fallback to simulated
+    output_path = node.request_shard(magnet, output_dir=output_dir)
+    
+    # Create metadata
+    shard = MemoryShard(
+        file_path=output_path,
+        embedding_model=magnet.required_model or "unknown",
+        dimension_size=magnet.dimension_size or 1536,
+        entry_count=0,
+        tags=magnet.tags,
+        payload_hash=magnet.info_hash,
+        display_name=magnet.display_name,
+        creator_agent_id=magnet.creator_agent_id,
+        creator_public_key=magnet.creator_public_key,
+    )
+    
+    # Fetch signature from tracker if available
+    if magnet.trackers:
+        try:
+            import requests
+            for tracker in magnet.trackers:
+                if tracker.startswith("http"):
+                    base_url = tracker.replace("/announce", "")
+                    response = requests.get(f"{base_url}/api/shard/{magnet.info_hash}", timeout=5)
+                    if response.status_code == 200:
+                        shard_data = response.json()
+                        if shard_data.get('signature'):
+                            shard.signature = shard_data['signature']
+                            shard.creator_agent_id = shard_data.get('creator_agent_id')
+                            shard.creator_public_key = shard_data.get('creator_public_key')
+                            logger.info(f"Retrieved signature from tracker ({len(shard.signature)} chars)")
+                        break
+        except Exception as e:
+            logger.debug(f"Could not fetch signature from tracker: {e}")
+    
+    metadata_path = shard.save_metadata()
+    
+    # Check if BitTorrent was used
+    was_real_download = node.bt_engine is not None
+    
+    return {
+        "status": "success",
+        "file_path": output_path,
+        "metadata_path": metadata_path,
+        "magnet": magnet.to_dict(),
+        "bittorrent_used": was_real_download,
+        "message": f"Downloaded: {magnet.display_name}" + ("" if was_real_download else " (simulated)")
+    }
+
+
+async def _download_many(node, magnet_uris: List[str], output_dir: str) -> List[Any]:
+    """Download several magnet links concurrently through one node, one worker thread each."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(_download_one, node, uri, output_dir) for uri in magnet_uris),
+        return_exceptions=True,
+    )
 
 
 def cmd_download(args):
-    """Download a memory shard from the P2P network."""
+    """Download one or more memory shards from the P2P network."""
     try:
-        # Parse magnet link
-        magnet = MoltMagnet.from_magnet_uri(args.magnet)
-        
         # Set output directory
         output_dir = args.output or "./downloads"
         
-        # Initialize node and download
-        logger.info(f"Downloading shard: {magnet.display_name}")
-        logger.info(f"Info hash: {magnet.info_hash}")
-        logger.info(f"Trackers: {len(magnet.trackers)}")
-        
-        node = SynapseNode(data_dir=output_dir)
-        
-        # Download using BitTorrent or fallback to simulated
-        output_path = node.request_shard(magnet, output_dir=output_dir)
-        
-        # Create metadata
-        shard = MemoryShard(
-            file_path=output_path,
-            embedding_model=magnet.required_model or "unknown",
-            dimension_size=magnet.dimension_size or 1536,
-            entry_count=0,
-            tags=magnet.tags,
-            payload_hash=magnet.info_hash,
-            display_name=magnet.display_name,
-            creator_agent_id=magnet.creator_agent_id,
-            creator_public_key=magnet.creator_public_key,
-        )
+        # Resolve the node once; worker threads share it
+        node = _get_node(data_dir=output_dir)
         
-        # Fetch signature from tracker if available
-        if magnet.trackers:
-            try:
-                import requests
-                for tracker in magnet.trackers:
-                    if tracker.startswith("http"):
-                        base_url = tracker.replace("/announce", "")
-                        response = requests.get(f"{base_url}/api/shard/{magnet.info_hash}", timeout=5)
-                        if response.status_code == 200:
-                            shard_data = response.json()
-                            if shard_data.get('signature'):
-                                shard.signature = shard_data['signature']
-                                shard.creator_agent_id = shard_data.get('creator_agent_id')
-                                shard.creator_public_key = shard_data.get('creator_public_key')
-                                logger.info(f"Retrieved signature from tracker ({len(shard.signature)} chars)")
-                            break
-            except Exception as e:
-                logger.debug(f"Could not fetch signature from tracker: {e}")
+        # A repeated magnet would start two sessions for the same info_hash
+        magnet_uris = list(dict.fromkeys(args.magnet))
         
-        metadata_path = shard.save_metadata()
+        if len(magnet_uris) == 1:
+            output_json(_download_one(node, magnet_uris[0], output_dir))
+            return
         
-        # Check if BitTorrent was used
-        was_real_download = node.bt_engine is not None
+        # Overlap tracker/peer latency across all requested magnets
+        results = asyncio.run(_download_many(node, magnet_uris, output_dir))
+        
+        downloads = []
+        for magnet_uri, result in zip(magnet_uris, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to download {magnet_uri}: {result}")
+                downloads.append({
+                    "status": "error",
+                    "magnet_link": magnet_uri,
+                    "error": str(result),
+                })
+            else:
+                downloads.append(result)
+        
+        succeeded = sum(1 for d in downloads if d["status"] == "success")
+        if not succeeded:
+            output_error(f"All {len(downloads)} downloads failed", downloads=downloads)
         
         output_json({
             "status": "success",
-            "file_path": output_path,
-            "metadata_path": metadata_path,
-            "magnet": magnet.to_dict(),
-            "bittorrent_used": was_real_download,
-            "message": f"Downloaded: {magnet.display_name}" + ("" if was_real_download else " (simulated)")
+            "downloads": downloads,
+            "count": succeeded,
+            "failed": len(downloads) - succeeded,
+            "message": f"Downloaded {succeeded} of {len(downloads)} shards"
         })
     
     except Exception as e:
-        logger.exception("Failed to download")
-        output_error(str(e))
+        log_exception("Failed to download", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_list_seeds(args):
     """List active seed sessions."""
     try:
         # Initialize node
-        node = SynapseNode()
-        
-        # Get active sessions
-        sessions = node.list_active_sessions()
+        node = _get_node()
         
-        # Filter to only seeding sessions
-        seeds = [s for s in sessions if s and s.get("status") == "seeding"]
+        # Get seeding sessions (filtered before status dicts are built)
+        seeds = node.list_active_sessions(status="seeding")
         
         output_json({
             "status": "success",
@@ -262,33 +387,38 @@ def cmd_list_seeds(args):
         })
     
     except Exception as e:
-        logger.exception("Failed to list seeds")
-        output_error(str(e))
+        log_exception("Failed to list seeds", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_share(args):
     """Share a file via Synapse Protocol (generate magnet + add to seeder)."""
     try:
+        from .core import MemoryShard, DEFAULT_TRACKERS
         from .seeder_client import SeederClient
         
         # Check if file exists
         file_path = Path(args.file).resolve()
-        if not Path(file_path).exists():
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             output_error(f"File not found: {file_path}")
         
         # Load or create metadata
-        metadata_path = Path(str(file_path) + ".meta.json")
+        metadata_path = file_path.with_name(f"{file_path.name}.meta.json")
+        
+        try:
+            shard = load_shard_metadata(metadata_path)
+        except FileNotFoundError:
+            shard = None
         
-        if metadata_path.exists():
-            with open(metadata_path) as f:
-                shard_data = json.load(f)
-            shard = MemoryShard.from_dict(shard_data)
+        if shard is not None:
             logger.info(f"Loaded existing metadata from {metadata_path}")
         else:
             # Create new shard metadata
             tags = []
             if args.tags:
-                tags = [t.strip() for t in args.tags.split(',') if t.strip()]
+                tags = split_csv(args.tags)
             
             # Try to load identity for creator fields
             creator_agent_id = None
@@ -361,7 +491,7 @@ def cmd_share(args):
                 "embedding_model": shard.embedding_model,
                 "dimension_size": shard.dimension_size,
                 "tags": shard.tags,
-                "file_size": file_path.stat().st_size,
+                "file_size": file_size,
                 "embedding": embedding_list,
             }
             
@@ -399,8 +529,8 @@ def cmd_share(args):
         })
     
     except Exception as e:
-        logger.exception("Failed to share file")
-        output_error(str(e))
+        log_exception("Failed to share file", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_unshare(args):
@@ -424,8 +554,8 @@ def cmd_unshare(args):
             output_error(f"Shard not found: {args.info_hash}")
     
     except Exception as e:
-        logger.exception("Failed to unshare")
-        output_error(str(e))
+        log_exception("Failed to unshare", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_list_shared(args):
@@ -454,8 +584,8 @@ def cmd_list_shared(args):
         })
     
     except Exception as e:
-        logger.exception("Failed to list shared files")
-        output_error(str(e))
+        log_exception("Failed to list shared files", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_seeder(args):
@@ -522,8 +652,8 @@ def cmd_seeder(args):
             output_error(f"Unknown action: {args.action}")
     
     except Exception as e:
-        logger.exception("Failed to control seeder")
-        output_error(str(e))
+        log_exception("Failed to control seeder", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
 def cmd_setup_identity(args):
@@ -559,18 +689,11 @@ def cmd_setup_identity(args):
             output_error(f"Identity generation failed: {result.stderr}")
     
     except Exception as e:
-        logger.exception("Failed to setup identity")
-        output_error(str(e))
+        log_exception("Failed to setup identity", e)
+        output_error(str(e), error_type=type(e).__name__)
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Synapse Protocol - P2P Memory Sharing for OpenClaw"
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-    
+def _build_share_parser(subparsers):
     # share command (replaces generate-magnet)
     share_parser = subparsers.add_parser("share", help="Share a file via P2P network")
     share_parser.add_argument("file", help="File to share")
@@ -579,19 +702,24 @@ def main():
     share_parser.add_argument("--model", help="Embedding model name (default: nomic-embed-text-v1)")
     share_parser.add_argument("--dimensions", type=int, help="Vector dimensions (default: 768)")
     share_parser.add_argument("--trackers", help="Comma-separated tracker URLs")
-    
-    # unshare command
+
+
+def _build_unshare_parser(subparsers):
     unshare_parser = subparsers.add_parser("unshare", help="Stop sharing a file")
     unshare_parser.add_argument("info_hash", help="Info hash of file to unshare")
-    
-    # list-shared command
-    list_shared_parser = subparsers.add_parser("list-shared", help="List shared files")
-    
-    # seeder command
+
+
+def _build_list_shared_parser(subparsers):
+    subparsers.add_parser("list-shared", help="List shared files")
+
+
+def _build_seeder_parser(subparsers):
     seeder_parser = subparsers.add_parser("seeder", help="Control seeder daemon")
     seeder_parser.add_argument("action", choices=["start", "stop", "status", "restart"], 
                                 help="Daemon action")
-    
+
+
+def _build_create_shard_parser(subparsers):
     # create-shard command (legacy)
     create_parser = subparsers.add_parser("create-shard", help="Create a memory shard")
     create_parser.add_argument("--source", required=True, help="Source vector database file")
@@ -600,57 +728,113 @@ def main():
     create_parser.add_argument("--model", help="Embedding model name")
     create_parser.add_argument("--dimensions", type=int, help="Vector dimensions")
     create_parser.add_argument("--count", type=int, help="Number of entries")
-    
+
+
+def _build_generate_magnet_parser(subparsers):
     # generate-magnet command (legacy - kept for compatibility)
     magnet_parser = subparsers.add_parser("generate-magnet", help="Generate magnet link (legacy)")
     magnet_parser.add_argument("--shard", required=True, help="Path to shard file")
     magnet_parser.add_argument("--trackers", help="Comma-separated tracker URLs")
-    
-    # search command
+
+
+def _build_search_parser(subparsers):
     search_parser = subparsers.add_parser("search", help="Search for memory shards")
     search_parser.add_argument("--query", required=True, help="Search query")
     search_parser.add_argument("--limit", type=int, default=10, help="Max results")
     search_parser.add_argument("--model", help="Filter by model")
-    
-    # download command
+
+
+def _build_download_parser(subparsers):
     download_parser = subparsers.add_parser("download", help="Download a memory shard")
-    download_parser.add_argument("--magnet", required=True, help="Magnet link")
+    download_parser.add_argument("--magnet", required=True, action="append",
+                                 help="Magnet link (repeat to download several in parallel)")
     download_parser.add_argument("--output", help="Output directory (default: ./downloads)")
-    
+
+
+def _build_list_seeds_parser(subparsers):
     # list-seeds command (legacy)
-    list_parser = subparsers.add_parser("list-seeds", help="List active seeds (legacy)")
-    
-    # setup-identity command
+    subparsers.add_parser("list-seeds", help="List active seeds (legacy)")
+
+
+def _build_setup_identity_parser(subparsers):
     identity_parser = subparsers.add_parser("setup-identity", help="Generate ML-DSA-87 identity")
     identity_parser.add_argument("--identity-dir", help="Directory to store keys (default: ~/.openclaw/identity)")
     identity_parser.add_argument("--force", action="store_true", help="Overwrite existing identity")
+
+
+# Subparser factories keyed by command name (order determines --help listing)
+SUBPARSER_BUILDERS = {
+    "share": _build_share_parser,
+    "unshare": _build_unshare_parser,
+    "list-shared": _build_list_shared_parser,
+    "seeder": _build_seeder_parser,
+    "create-shard": _build_create_shard_parser,
+    "generate-magnet": _build_generate_magnet_parser,
+    "search": _build_search_parser,
+    "download": _build_download_parser,
+    "list-seeds": _build_list_seeds_parser,
+    "setup-identity": _build_setup_identity_parser,
+}
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Synapse Protocol - P2P Memory Sharing for OpenClaw"
+    )
+    
+    parser.add_argument("--compact", action="store_true",
+                        help="Emit compact single-line JSON (or set SYNAPSE_JSON_COMPACT=1)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log full tracebacks on failure (or set SYNAPSE_DEBUG=1)")
+    
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+    
+    # Only build the subparser for the requested command; fall back to
+    # building all of them for --help or unknown commands
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    if command in SUBPARSER_BUILDERS:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
     
     args = parser.parse_args()
     
+    global _COMPACT_OUTPUT, _DEBUG
+    if args.compact:
+        _COMPACT_OUTPUT = True
+    if args.verbose:
+        _DEBUG = True
+    
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
     # Route to appropriate command handler
-    commands = {
-        "share": cmd_share,
-        "unshare": cmd_unshare,
-        "list-shared": cmd_list_shared,
-        "seeder": cmd_seeder,
-        "create-shard": cmd_create_shard,
-        "generate-magnet": cmd_generate_magnet,
-        "search": cmd_search,
-        "download": cmd_download,
-        "list-seeds": cmd_list_seeds,
-        "setup-identity": cmd_setup_identity,
-    }
-    
-    handler = commands.get(args.command)
-    if handler:
-        handler(args)
-    else:
-        output_error(f"Unknown command: {args.command}")
-
+    match args.command:
+        case "share":
+            cmd_share(args)
+        case "unshare":
+            cmd_unshare(args)
+        case "list-shared":
+            cmd_list_shared(args)
+        case "seeder":
+            cmd_seeder(args)
+        case "create-shard":
+            cmd_create_shard(args)
+        case "generate-magnet":
+            cmd_generate_magnet(args)
+        case "search":
+            cmd_search(args)
+        case "download":
+            cmd_download(args)
+        case "list-seeds":
+            cmd_list_seeds(args)
+        case "setup-identity":
+            cmd_setup_identity(args)
+        case _:
+            output_error(f"Unknown command: {args.command}")
 
 if __name__ == "__main__":
     main()
@@ -6,14 +6,26 @@ and tracker communication.
 """
 
 import asyncio
+import base64
 import hashlib
+import heapq
+import hmac
 import json
 import logging
-from dataclasses import dataclass, field
+import mmap
+import multiprocessing
+import os
+import re
+import threading
+from dataclasses import FrozenInstanceError, InitVar, dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Callable, Any
+from typing import List, Optional, Dict, Callable, Any, Tuple, Iterable, Iterator
 from datetime import datetime, timedelta
 import time
+from array import array
+from operator import attrgetter
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from .core import MemoryShard, MoltMagnet, DEFAULT_TRACKERS
 
@@ -24,25 +36,375 @@ except ImportError:
     BITTORRENT_AVAILABLE = False
     BitTorrentEngine = None
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Hash prefixes accepted by verify_integrity ("<prefix>:<hex>")
+HASH_PREFIXES = {
+    "sha1": "sha1",
+    "sha256": "sha256",
+    "b3": "blake3",
+    "blake3": "blake3",
+}
+
+# Kademlia parameters (BitTorrent mainline DHT uses 160-bit ids, k=8)
+DHT_ID_BITS = 160
+K_BUCKET_SIZE = 8
+
+# Creator trust scores are reused for this long before re-querying
+TRUST_CACHE_TTL_SECONDS = 60
+TRUST_CACHE_MAX_ENTRIES = 4096
+
+# Weight of the newest sample in each peer's throughput average
+PEER_RATE_EWMA_ALPHA = 0.1
+# Peers requested from in parallel (BitTorrent's default unchoke slot count)
+MAX_ACTIVE_PEERS = 4
+
+# Characters dropped from display names when building download paths;
+# \w is Unicode-aware, matching the str.isalnum() rule plus "_"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.\- ]+")
+
+
+def dht_id_from(identifier: str) -> bytes:
+    """
+    Maps a node or peer identifier onto the 160-bit DHT keyspace.
+    
+    40-character hex ids are used as-is; anything else (e.g. the
+    OPENCLAW-... node ids) is hashed with SHA-1.
+    """
+    if len(identifier) == 40:
+        try:
+            return bytes.fromhex(identifier)
+        except ValueError:
+            pass
+    return hashlib.sha1(identifier.encode("utf-8")).digest()
+
+
+def _hash_mmap(path: Any, algorithm: str) -> str:
+    """
+    Hash a file by memory-mapping it.
+    
+    hashlib reads straight from the page cache through the buffer
+    protocol, so the file is never copied into a Python bytes object.
+    """
+    hasher = hashlib.new(algorithm, usedforsecurity=False)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Zero-length files cannot be mapped
+            return hasher.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mm)
+    return hasher.hexdigest()
+
+
+def _hash_source(source: Any, algorithm: str) -> str:
+    """
+    Hash a file path, binary file object, chunk iterable or bytes.
+    
+    Paths are memory-mapped (see _hash_mmap); file objects go through
+    hashlib.file_digest, which reads into a reusable buffer. Both hash
+    with the GIL released.
+    """
+    if algorithm == "blake3":
+        # Multithreaded tree hashing; update_mmap hashes files without copying
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if isinstance(source, (str, os.PathLike)):
+            hasher.update_mmap(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            hasher.update(source)
+        elif hasattr(source, "read"):
+            while chunk := source.read(1 << 20):
+                hasher.update(chunk)
+        else:
+            for chunk in source:
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    def new_hasher():
+        return hashlib.new(algorithm, usedforsecurity=False)
+    
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        hasher = new_hasher()
+        hasher.update(source)
+        return hasher.hexdigest()
+    
+    if isinstance(source, (str, os.PathLike)):
+        return _hash_mmap(source, algorithm)
+    
+    if hasattr(source, "readinto"):
+        return hashlib.file_digest(source, new_hasher).hexdigest()
+    
+    hasher = new_hasher()
+    for chunk in source:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _init_signature_worker():
+    """ProcessPoolExecutor initializer: build this worker's verifier once."""
+    from .identity import IdentityManager, get_verifier
+    get_verifier(IdentityManager.ALGORITHM)
+
+
+def _verify_signature_job(job: Tuple[bytes, bytes, bytes]) -> bool:
+    """Verify one (message, signature, public_key) triple in a pool worker."""
+    from .identity import IdentityManager, get_verifier
+    message, signature, public_key = job
+    try:
+        return get_verifier(IdentityManager.ALGORITHM).verify(message, signature, public_key)
+    except Exception:
+        return False
 
-@dataclass
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for one peer's transfers.
+    
+    Tokens (bytes) refill continuously at `rate` per second up to `burst`.
+    The bucket is topped up lazily inside consume(), so no background
+    refill task is needed. A caller that overdraws the bucket sleeps
+    until its debt is repaid, which also queues concurrent callers fairly.
+    """
+    
+    __slots__ = ("rate", "burst", "tokens", "_last")
+    
+    def __init__(self, rate: float, burst: float):
+        """
+        Args:
+            rate: Sustained rate in bytes per second
+            burst: Maximum bytes that may be sent without waiting
+            
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if not rate > 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate!r}")
+        if not burst > 0:
+            raise ValueError(f"TokenBucket burst must be positive, got {burst!r}")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._last = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def try_consume(self, n: int) -> bool:
+        """Takes n tokens if they are available right now."""
+        self._refill()
+        if self.tokens < n:
+            return False
+        self.tokens -= n
+        return True
+    
+    async def consume(self, n: int):
+        """Takes n tokens, sleeping until the bucket can cover them."""
+        self._refill()
+        self.tokens -= n
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+@dataclass(slots=True)
 class Peer:
-    """Represents a peer in the P2P network."""
+    """
+    Represents a peer in the P2P network.
+    
+    DHT routing-table peers are stored as Peer objects. Session peers live
+    in a PeerTable, whose rows are read back as read-only Peer snapshots;
+    update those through PeerTable.touch/record_transfer by row index.
+    """
     peer_id: str
     ip: str
     port: int
-    last_seen: datetime = field(default_factory=datetime.utcnow)
+    last_seen_ns: int = field(default_factory=time.monotonic_ns)  # time.monotonic_ns() clock
     uploaded: int = 0
     downloaded: int = 0
+    ewma_bps: float = 0.0  # Smoothed receive rate, bytes/second
+    rate_limiter: Optional[TokenBucket] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def last_seen(self) -> datetime:
+        """Wall-clock time the peer was last seen (for display only)."""
+        return datetime.utcnow() - timedelta(microseconds=(time.monotonic_ns() - self.last_seen_ns) // 1000)
+    
+    def touch(self):
+        """Mark the peer as seen now."""
+        self.last_seen_ns = time.monotonic_ns()
     
     def is_alive(self, timeout_seconds: int = 300) -> bool:
         """Check if peer is still active."""
-        return (datetime.utcnow() - self.last_seen).total_seconds() < timeout_seconds
+        return time.monotonic_ns() - self.last_seen_ns < timeout_seconds * 1_000_000_000
 
 
-@dataclass
+class _PeerSnapshot(Peer):
+    """
+    Read-only Peer built from a PeerTable row.
+    
+    Writes would be lost when the snapshot is discarded, so they raise
+    FrozenInstanceError (including via Peer.touch) instead of passing silently.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+    
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(
+            f"cannot assign to field {name!r}: PeerTable rows are snapshots, update them by index"
+        )
+    
+    def __delattr__(self, name):
+        raise FrozenInstanceError(
+            f"cannot delete field {name!r}: PeerTable rows are snapshots, update them by index"
+        )
+
+
+class PeerTable:
+    """
+    Struct-of-arrays store for a session's peers.
+    
+    Numeric columns live in contiguous array.array buffers, so liveness
+    checks and pruning run as single NumPy passes over zero-copy views
+    instead of touching one Peer object per row. Indexing or iterating
+    yields read-only Peer snapshots built from the columns: writing to one
+    raises FrozenInstanceError, so mutate rows with touch() and
+    record_transfer().
+    """
+    
+    __slots__ = (
+        "peer_ids", "ips", "ports", "last_seen_ns", "uploaded", "downloaded", "ewma_bps", "rate_limiters"
+    )
+    
+    def __init__(self, peers: Iterable[Peer] = ()):
+        self.peer_ids: List[str] = []
+        self.ips: List[str] = []
+        self.rate_limiters: List[Optional[TokenBucket]] = []
+        self.ports = array("H")
+        self.last_seen_ns = array("q")
+        self.uploaded = array("q")
+        self.downloaded = array("q")
+        self.ewma_bps = array("d")
+        for peer in peers:
+            self.add(peer)
+    
+    def __len__(self) -> int:
+        return len(self.peer_ids)
+    
+    def __getitem__(self, index: int) -> Peer:
+        return _PeerSnapshot(
+            peer_id=self.peer_ids[index],
+            ip=self.ips[index],
+            port=self.ports[index],
+            last_seen_ns=self.last_seen_ns[index],
+            uploaded=self.uploaded[index],
+            downloaded=self.downloaded[index],
+            ewma_bps=self.ewma_bps[index],
+            rate_limiter=self.rate_limiters[index],
+        )
+    
+    def __iter__(self) -> Iterator[Peer]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def add(self, peer: Peer):
+        """Appends a peer as a new row."""
+        self.peer_ids.append(peer.peer_id)
+        self.ips.append(peer.ip)
+        self.ports.append(peer.port)
+        self.last_seen_ns.append(peer.last_seen_ns)
+        self.uploaded.append(peer.uploaded)
+        self.downloaded.append(peer.downloaded)
+        self.ewma_bps.append(peer.ewma_bps)
+        self.rate_limiters.append(peer.rate_limiter)
+    
+    append = add  # list-compatible spelling for code that built session.peers as a list
+    
+    def touch(self, index: int):
+        """Mark the peer at index as seen now."""
+        self.last_seen_ns[index] = time.monotonic_ns()
+    
+    def record_transfer(self, index: int, nbytes: int, seconds: float):
+        """Fold a completed chunk transfer into the peer's throughput average."""
+        if seconds > 0:
+            self.ewma_bps[index] += PEER_RATE_EWMA_ALPHA * (nbytes / seconds - self.ewma_bps[index])
+    
+    def limit_rate(self, rate: float, burst: Optional[float] = None):
+        """
+        Gives every peer its own TokenBucket of rate bytes/second.
+        
+        Args:
+            rate: Per-peer sustained rate in bytes per second
+            burst: Per-peer burst size in bytes (defaults to one second of rate)
+        """
+        burst = rate if burst is None else burst
+        self.rate_limiters = [TokenBucket(rate, burst) for _ in self.peer_ids]
+    
+    def fastest(self, k: int) -> List[int]:
+        """Returns the row indices of the k peers with the highest ewma_bps."""
+        return heapq.nlargest(k, range(len(self)), key=self.ewma_bps.__getitem__)
+    
+    def alive_mask(self, timeout_seconds: int = 300):
+        """
+        Returns a boolean NumPy mask of peers seen within timeout_seconds.
+        
+        Equivalent to calling Peer.is_alive on every row.
+        """
+        import numpy as np
+        
+        last_seen = np.frombuffer(self.last_seen_ns, dtype=np.int64)
+        return (time.monotonic_ns() - last_seen) < timeout_seconds * 1_000_000_000
+    
+    def prune(self, timeout_seconds: int = 300) -> int:
+        """
+        Drops peers that have not been seen within timeout_seconds.
+        
+        Returns:
+            Number of peers removed
+        """
+        if not self.peer_ids:
+            return 0
+        
+        import numpy as np
+        
+        keep = np.flatnonzero(self.alive_mask(timeout_seconds))
+        removed = len(self) - len(keep)
+        if not removed:
+            return 0
+        
+        # Compact each column with one fancy-indexing gather
+        for name, dtype in (
+            ("ports", np.uint16),
+            ("last_seen_ns", np.int64),
+            ("uploaded", np.int64),
+            ("downloaded", np.int64),
+            ("ewma_bps", np.float64),
+        ):
+            column = getattr(self, name)
+            kept = np.frombuffer(column, dtype=dtype)[keep]
+            setattr(self, name, array(column.typecode, kept.tobytes()))
+        self.peer_ids = [self.peer_ids[i] for i in keep]
+        self.ips = [self.ips[i] for i in keep]
+        self.rate_limiters = [self.rate_limiters[i] for i in keep]
+        return removed
+
+
+_STATIC_STATUS_FIELDS = ("info_hash", "file_path", "started_at")
+_get_static_status_fields = attrgetter(*_STATIC_STATUS_FIELDS)
+
+
+@dataclass(slots=True)
 class TorrentSession:
     """Tracks an active download or seed session."""
     info_hash: str
@@ -50,11 +412,68 @@ class TorrentSession:
     total_size: int
     downloaded: int = 0
     uploaded: int = 0
-    peers: List[Peer] = field(default_factory=list)
-    status: str = "idle"  # idle, downloading, seeding, paused, error
+    peers: PeerTable = field(default_factory=PeerTable)
+    status: InitVar[str] = "idle"  # idle, downloading, seeding, paused, error (see _set_status)
     started_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
+    # Notified as (session, old_status, new_status); set by the owning SynapseNode
+    status_listener: Optional[Callable[["TorrentSession", str, str], None]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Cached status fields that never change after start (see static_view)
+    _static_view: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Backing slot for the status property
+    _status: str = field(default="idle", init=False)
+    
+    def __post_init__(self, status: str):
+        self._status = status
+    
+    def _get_status(self) -> str:
+        return self._status
+    
+    def _set_status(self, status: str):
+        # Only status writes run Python code; counter writes such as
+        # downloaded += n stay plain slot stores
+        old = self._status
+        self._status = status
+        if self.status_listener is not None and old != status:
+            self.status_listener(self, old, status)
+    
+    @property
+    def static_view(self) -> Dict[str, Any]:
+        """
+        Status-dict entries that are fixed for the session's lifetime.
+        
+        info_hash, file_path and started_at are never reassigned once a
+        session exists; reset _static_view to None if that ever changes.
+        """
+        view = self._static_view
+        if view is None:
+            info_hash, file_path, started_at = _get_static_status_fields(self)
+            view = self._static_view = {
+                "info_hash": info_hash,
+                "file_path": file_path,
+                "started_at": started_at.isoformat(),
+            }
+        return view
+    
+    def select_peers(self, k: int = MAX_ACTIVE_PEERS) -> List[Peer]:
+        """
+        Picks the peers to request chunks from in parallel.
+        
+        Peers are ranked by measured throughput (ewma_bps); ones without
+        samples yet rank last, in discovery order.
+        
+        Args:
+            k: Maximum number of peers to return
+            
+        Returns:
+            Up to k peer snapshots, fastest first
+        """
+        return [self.peers[i] for i in self.peers.fastest(k)]
     
     @property
     def progress(self) -> float:
@@ -76,6 +495,15 @@ class TorrentSession:
         return self.uploaded / self.downloaded
 
 
+# Installed after the dataclass is built: a property in the class body would
+# be taken as the default of the status InitVar
+TorrentSession.status = property(
+    TorrentSession._get_status,
+    TorrentSession._set_status,
+    doc="Session state; assigning it keeps the owning node's status index in sync.",
+)
+
+
 class SynapseNode:
     """
     The P2P client running inside the OpenClaw Agent.
@@ -109,7 +537,26 @@ class SynapseNode:
         
         self.trackers = trackers or DEFAULT_TRACKERS.copy()
         self.sessions: Dict[str, TorrentSession] = {}
-        self.dht_routing_table: Dict[str, Peer] = {}
+        # status -> info_hashes in that state (dict used as an ordered set)
+        self._status_index: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # Guards sessions and _status_index; download worker threads share the node
+        self._sessions_lock = threading.RLock()
+        # file_path -> size in bytes, so re-announcing a shard skips the stat;
+        # dropped whenever the file is re-hashed, since its content may have changed
+        self._file_sizes: Dict[str, int] = {}
+        # agent_id -> (quality tracker, trust score, expiry in monotonic ns),
+        # oldest first; every entry has the same TTL, so also soonest-expiring first
+        self._trust_cache: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        # Kademlia routing table: bucket i holds peers at XOR distance [2^i, 2^(i+1))
+        self.dht_id = dht_id_from(self.node_id)
+        self._dht_id_int = int.from_bytes(self.dht_id, "big")
+        # (buckets hold peer ids, least recently seen first)
+        self.buckets: List[List[str]] = [[] for _ in range(DHT_ID_BITS)]
+        # peer_id -> (20-byte DHT id, mapped once at insert, Peer)
+        self._dht_peers: Dict[str, Tuple[bytes, Peer]] = {}
+        # Lazily rebuilt (peer ids, N x 20 uint8 id matrix) snapshot for closest_peers;
+        # cleared only when the set of known peer ids changes
+        self._peer_id_matrix = None
         
         # Initialize BitTorrent engine if available and requested
         self.bt_engine = None
@@ -129,6 +576,7 @@ class SynapseNode:
         self.total_uploaded = 0
         self.total_downloaded = 0
         self.start_time = datetime.utcnow()
+        self._start_ns = time.monotonic_ns()
         
         logger.info(f"SynapseNode initialized: {self.node_id} on port {self.listen_port}")
     
@@ -144,6 +592,7 @@ class SynapseNode:
         Args:
             shard: The MemoryShard to announce
             trackers: Optional list of trackers. Uses node defaults if None.
+                      The list is treated as read-only and may be shared.
             
         Returns:
             MoltMagnet link for distribution
@@ -151,6 +600,7 @@ class SynapseNode:
         # Ensure hash is computed
         if not shard.payload_hash:
             shard.compute_hash()
+            self._file_sizes.pop(shard.file_path, None)
         
         use_trackers = trackers or self.trackers
         
@@ -179,15 +629,16 @@ class SynapseNode:
             except Exception as e:
                 logger.error(f"BitTorrent seeding failed: {e}, using hash-only mode")
         
-        # Create magnet link
+        # Create magnet link (with its own tracker list: callers may edit it,
+        # and use_trackers can be the node's or the caller's list)
         magnet = MoltMagnet(
             info_hash=shard.payload_hash,
-            display_name=shard.display_name or Path(shard.file_path).name,
-            trackers=use_trackers,
+            display_name=shard.display_name or os.path.basename(shard.file_path),
+            trackers=list(use_trackers),
             required_model=shard.embedding_model,
             dimension_size=shard.dimension_size,
             tags=shard.tags,
-            file_size=Path(shard.file_path).stat().st_size,
+            file_size=self._get_file_size(shard.file_path),
             creator_agent_id=shard.creator_agent_id,
             creator_public_key=shard.creator_public_key,
         )
@@ -201,7 +652,7 @@ class SynapseNode:
             status="seeding",
         )
         
-        self.sessions[shard.payload_hash] = session
+        self._add_session(session)
         
         # Announce to trackers with embedding
         self._announce_to_trackers(magnet, shard)
@@ -209,6 +660,42 @@ class SynapseNode:
         logger.info(f"Announced shard: {shard.display_name} ({shard.payload_hash})")
         return magnet
     
+    def _get_file_size(self, file_path: str) -> int:
+        """Returns the size of a shard file, stat-ing it only until it is cached."""
+        size = self._file_sizes.get(file_path)
+        if size is None:
+            size = self._file_sizes[file_path] = os.stat(file_path).st_size
+        return size
+    
+    def announce_shards(
+        self,
+        shards: List[MemoryShard],
+        trackers: List[str] = None,
+    ) -> List[MoltMagnet]:
+        """
+        Announces several shards, hashing them in parallel first.
+        
+        hashlib releases the GIL while hashing large buffers, so hashing
+        on a thread pool scales across cores; the announcements themselves
+        are then made in order.
+        
+        Args:
+            shards: MemoryShards to announce
+            trackers: Optional list of trackers. Uses node defaults if None.
+            
+        Returns:
+            MoltMagnet links, in the same order as shards
+        """
+        pending = [shard for shard in shards if not shard.payload_hash]
+        if pending:
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(MemoryShard.compute_hash, pending))
+            for shard in pending:
+                self._file_sizes.pop(shard.file_path, None)
+        
+        return [self.announce_shard(shard, trackers) for shard in shards]
+    
     def _announce_to_trackers(self, magnet: MoltMagnet, shard: MemoryShard):
         """
         Announces presence to all trackers.
@@ -216,8 +703,6 @@ class SynapseNode:
         For HTTP trackers with /api/register endpoint, sends full shard metadata + embedding.
         For UDP trackers, sends standard BitTorrent announce.
         """
-        import requests
-        
         # Generate embedding from file content
         embedding_list = None
         try:
@@ -237,51 +722,92 @@ class SynapseNode:
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
         
-        for tracker in magnet.trackers:
-            logger.debug(f"Announcing {magnet.info_hash} to {tracker}")
-            
-            # Check if this is an HTTP tracker with /api/register
-            if tracker.startswith("http://") or tracker.startswith("https://"):
-                try:
-                    # Extract base URL
-                    base_url = tracker.replace("/announce", "")
-                    register_url = f"{base_url}/api/register"
-                    
-                    # Prepare registration data
-                    data = {
-                        "info_hash": magnet.info_hash,
-                        "display_name": magnet.display_name,
-                        "embedding_model": magnet.required_model,
-                        "dimension_size": magnet.dimension_size,
-                        "tags": magnet.tags,
-                        "file_size": magnet.file_size,
-                    }
-                    
-                    # Add embedding vector if generated
-                    if embedding_list:
-                        data["embedding"] = embedding_list
-                    
-                    # Add identity if available
-                    if magnet.creator_agent_id:
-                        data["creator_agent_id"] = magnet.creator_agent_id
-                    if magnet.creator_public_key:
-                        data["creator_public_key"] = magnet.creator_public_key
-                    if magnet.signature:
-                        data["signature"] = magnet.signature
-                    
-                    logger.info(f"Registering with tracker: {register_url}")
-                    response = requests.post(register_url, json=data, timeout=10)
+        asyncio.run(self._announce_all(magnet, shard, embedding_list))
+    
+    async def _announce_all(
+        self,
+        magnet: MoltMagnet,
+        shard: MemoryShard,
+        embedding_list: Optional[List[float]],
+    ):
+        """
+        Announces to every tracker concurrently over one pooled HTTP client.
+        
+        Announces are independent and network-bound, so wall time is bounded
+        by the slowest tracker rather than the sum of all round-trips.
+        """
+        if not any(tracker.startswith(("http://", "https://")) for tracker in magnet.trackers):
+            return
+        
+        try:
+            import httpx
+        except ImportError:
+            logger.error("httpx not installed; skipping HTTP tracker registration")
+            return
+        
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+        async with httpx.AsyncClient(limits=limits, timeout=10) as client:
+            # _announce_one logs and swallows its own failures
+            await asyncio.gather(
+                *(
+                    self._announce_one(client, tracker, magnet, shard, embedding_list)
+                    for tracker in magnet.trackers
+                )
+            )
+    
+    async def _announce_one(
+        self,
+        client,
+        tracker: str,
+        magnet: MoltMagnet,
+        shard: MemoryShard,
+        embedding_list: Optional[List[float]],
+    ):
+        """Announces a single shard to a single tracker."""
+        logger.debug("Announcing %s to %s", magnet.info_hash, tracker)
+        
+        # Check if this is an HTTP tracker with /api/register
+        if tracker.startswith("http://") or tracker.startswith("https://"):
+            try:
+                # Extract base URL
+                base_url = tracker.replace("/announce", "")
+                register_url = f"{base_url}/api/register"
+                
+                # Prepare registration data
+                data = {
+                    "info_hash": magnet.info_hash,
+                    "display_name": magnet.display_name,
+                    "embedding_model": magnet.required_model,
+                    "dimension_size": magnet.dimension_size,
+                    "tags": magnet.tags,
+                    "file_size": magnet.file_size,
+                }
+                
+                # Add embedding vector if generated
+                if embedding_list:
+                    data["embedding"] = embedding_list
+                
+                # Add identity if available
+                if magnet.creator_agent_id:
+                    data["creator_agent_id"] = magnet.creator_agent_id
+                if magnet.creator_public_key:
+                    data["creator_public_key"] = magnet.creator_public_key
+                if shard.signature:
+                    data["signature"] = shard.signature
+                
+                logger.info(f"Registering with tracker: {register_url}")
+                response = await client.post(register_url, json=data)
+                
+                if response.status_code == 200:
+                    logger.info(f"Successfully registered with {base_url}")
+                else:
+                    logger.warning(f"Tracker registration failed: {response.status_code} - {response.text}")
                     
-                    if response.status_code == 200:
-                        logger.info(f"Successfully registered with {base_url}")
-                    else:
-                        logger.warning(f"Tracker registration failed: {response.status_code} - {response.text}")
-                        
-                except Exception as e:
-                    logger.error(f"Failed to register with {tracker}: {e}")
-            
-            # UDP trackers would use standard BitTorrent protocol
-            # TODO: Implement UDP announce protocol
+            except Exception as e:
+                logger.error(f"Failed to register with {tracker}: {e}")
+        
+        # UDP trackers would use standard BitTorrent protocol
+        # TODO: Implement UDP announce protocol
     
     def request_shard(
         self,
@@ -310,17 +836,17 @@ class SynapseNode:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Sanitize filename
-        safe_name = "".join(c for c in magnet.display_name if c.isalnum() or c in "._- ")
-        output_path = output_dir / safe_name
+        safe_name = _UNSAFE_FILENAME_CHARS.sub("", magnet.display_name)
+        output_path = str(output_dir / safe_name)
         
-        # Check if already downloading or seeding
-        if magnet.info_hash in self.sessions:
-            session = self.sessions[magnet.info_hash]
+        # Check if already downloading or seeding (one hash probe)
+        session = self.sessions.get(magnet.info_hash)
+        if session is not None:
             if session.is_complete:
                 logger.info(f"Shard already downloaded: {output_path}")
-                return str(output_path)
+                return output_path
             logger.info(f"Shard already downloading: {session.progress:.2f}%")
-            return str(output_path)
+            return output_path
         
         # If BitTorrent engine available, use it for real P2P download
         if self.bt_engine:
@@ -349,15 +875,15 @@ class SynapseNode:
                     # Create session entry
                     session = TorrentSession(
                         info_hash=magnet.info_hash,
-                        file_path=str(output_path),
+                        file_path=output_path,
                         total_size=magnet.file_size or 0,
                         downloaded=magnet.file_size or 0,
                         status="seeding",
                     )
                     session.completed_at = datetime.utcnow()
-                    self.sessions[magnet.info_hash] = session
+                    self._add_session(session)
                     
-                    return str(output_path)
+                    return output_path
                 else:
                     raise RuntimeError("Download failed - file not complete")
                     
@@ -371,43 +897,16 @@ class SynapseNode:
         # Create download session
         session = TorrentSession(
             info_hash=magnet.info_hash,
-            file_path=str(output_path),
+            file_path=output_path,
             total_size=magnet.file_size or 0,
             status="downloading",
         )
         
-        self.sessions[magnet.info_hash] = session
+        self._add_session(session)
         
         # Discover peers (simulated)
         peers = self._discover_peers(magnet)
-        session.peers = peers
-        
-        if not peers:
-            session.status = "error"
-            session.error_message = "No peers found"
-            logger.error(f"No peers available for {magnet.display_name}")
-            raise RuntimeError("No peers found for download")
-        
-        logger.info(f"Found {len(peers)} peers for {magnet.display_name}")
-        
-        # Begin download (simulated)
-        self._download_from_peers(session, progress_callback)
-        
-        return str(output_path)
-        
-        # Create download session
-        session = TorrentSession(
-            info_hash=magnet.info_hash,
-            file_path=str(output_path),
-            total_size=magnet.file_size or 0,
-            status="downloading",
-        )
-        
-        self.sessions[magnet.info_hash] = session
-        
-        # Discover peers
-        peers = self._discover_peers(magnet)
-        session.peers = peers
+        session.peers = PeerTable(peers)
         
         if not peers:
             session.status = "error"
@@ -420,7 +919,31 @@ class SynapseNode:
         # Begin download (simulated)
         self._download_from_peers(session, progress_callback)
         
-        return str(output_path)
+        return output_path
+    
+    def _add_session(self, session: TorrentSession):
+        """Registers a session and keeps the per-status index in sync with it."""
+        with self._sessions_lock:
+            previous = self.sessions.get(session.info_hash)
+            if previous is not None:
+                self._drop_session(previous)
+            
+            self.sessions[session.info_hash] = session
+            self._status_index[session.status][session.info_hash] = None
+            session.status_listener = self._on_session_status_change
+    
+    def _drop_session(self, session: TorrentSession):
+        """Unregisters a session and removes it from the per-status index."""
+        with self._sessions_lock:
+            session.status_listener = None
+            self._status_index[session.status].pop(session.info_hash, None)
+            self.sessions.pop(session.info_hash, None)
+    
+    def _on_session_status_change(self, session: TorrentSession, old: str, new: str):
+        """Moves a session between per-status index buckets."""
+        with self._sessions_lock:
+            self._status_index[old].pop(session.info_hash, None)
+            self._status_index[new][session.info_hash] = None
     
     def _discover_peers(self, magnet: MoltMagnet) -> List[Peer]:
         """
@@ -439,7 +962,7 @@ class SynapseNode:
         # - Return real peer list
         
         # Simulated peer discovery
-        logger.debug(f"Discovering peers for {magnet.info_hash}")
+        logger.debug("Discovering peers for %s", magnet.info_hash)
         
         # In a real system, return actual peers from tracker/DHT
         # For now, return empty list (simulation mode)
@@ -470,6 +993,11 @@ class SynapseNode:
         
         logger.info(f"Starting download: {session.file_path}")
         
+        # Request from the fastest peers first; rates are re-ranked as
+        # chunks complete via PeerTable.record_transfer
+        active_peers = session.select_peers()
+        logger.debug("Requesting chunks from %d of %d peers", len(active_peers), len(session.peers))
+        
         # Simulated download
         # In production, this would be async and handle real peer connections
         session.status = "seeding"
@@ -481,30 +1009,45 @@ class SynapseNode:
         
         logger.info(f"Download complete: {session.file_path}")
     
-    def verify_integrity(self, downloaded_data: bytes, expected_hash: str) -> bool:
+    def verify_integrity(self, source: Any, expected_hash: str) -> bool:
         """
         Standard hash-check to ensure no bit-rot or tampering.
         
+        Files are hashed incrementally, so the payload never has to be
+        held in memory as a single bytes object.
+        
         Args:
-            downloaded_data: The raw bytes of the downloaded file
-            expected_hash: The expected SHA-1 or SHA-256 hash
+            source: Path to the downloaded file, a binary file object,
+                    an iterable of byte chunks, or the raw bytes
+            expected_hash: The expected hash. Bare 40/64-char hex is taken
+                           as SHA-1/SHA-256; "b3:", "sha1:" or "sha256:"
+                           prefixes select the algorithm explicitly.
             
         Returns:
             True if hash matches, False otherwise
         """
-        # Auto-detect hash algorithm by length
-        if len(expected_hash) == 40:  # SHA-1
-            hasher = hashlib.sha1()
+        # Explicit "<algo>:<hex>" prefix, otherwise auto-detect by length
+        prefix, sep, digest = expected_hash.partition(":")
+        if sep:
+            algorithm = HASH_PREFIXES.get(prefix.lower())
+        elif len(expected_hash) == 40:  # SHA-1
+            algorithm, digest = "sha1", expected_hash
         elif len(expected_hash) == 64:  # SHA-256
-            hasher = hashlib.sha256()
+            algorithm, digest = "sha256", expected_hash
         else:
+            algorithm = None
+        
+        if algorithm is None:
             logger.error(f"Unknown hash format: {expected_hash}")
             return False
         
-        hasher.update(downloaded_data)
-        computed_hash = hasher.hexdigest()
+        if algorithm == "blake3" and not BLAKE3_AVAILABLE:
+            logger.error("BLAKE3 hash given but blake3 is not installed (pip install blake3)")
+            return False
+        
+        computed_hash = _hash_source(source, algorithm)
         
-        is_valid = computed_hash == expected_hash
+        is_valid = hmac.compare_digest(computed_hash.encode(), digest.lower().encode())
         
         if not is_valid:
             logger.error(f"Hash mismatch! Expected: {expected_hash}, Got: {computed_hash}")
@@ -513,6 +1056,23 @@ class SynapseNode:
         
         return is_valid
     
+    def verify_integrity_batch(self, items: List[Tuple[Any, str]]) -> List[bool]:
+        """
+        Runs verify_integrity over many (source, expected_hash) pairs in parallel.
+        
+        Args:
+            items: Pairs accepted by verify_integrity
+            
+        Returns:
+            Verification results, in the same order as items
+        """
+        if not items:
+            return []
+        
+        workers = min(len(items), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: self.verify_integrity(*item), items))
+    
     def verify_shard_signature(self, shard: MemoryShard) -> bool:
         """
         Verify the PQ signature on a downloaded shard.
@@ -539,6 +1099,75 @@ class SynapseNode:
             logger.error(f"Signature verification failed: {e}")
             return False
     
+    def verify_shards_bulk(self, shards: List[MemoryShard]) -> List[bool]:
+        """
+        Verify the PQ signatures on many shards across all CPU cores.
+        
+        ML-DSA-87 verification is CPU-bound, so signed shards are fanned
+        out to a process pool; each worker builds its oqs verifier once
+        in the pool initializer and reuses it for every job.
+        
+        Args:
+            shards: MemoryShards to verify
+            
+        Returns:
+            Results in the same order as shards, with the same semantics
+            as verify_shard_signature (unsigned shards pass)
+        """
+        from .identity import OQS_AVAILABLE
+        
+        if not OQS_AVAILABLE:
+            return [self.verify_shard_signature(shard) for shard in shards]
+        
+        results = [True] * len(shards)
+        jobs = []
+        job_indices = []
+        for i, shard in enumerate(shards):
+            if not shard.signature or not shard.creator_public_key:
+                logger.warning(f"Shard {shard.display_name} is unsigned")
+                continue
+            
+            # Same canonical message as IdentityManager.verify_json_signature
+            data = shard.to_dict()
+            data.pop("signature")
+            try:
+                jobs.append((
+                    json.dumps(data, sort_keys=True).encode("utf-8"),
+                    base64.b64decode(shard.signature),
+                    base64.b64decode(shard.creator_public_key),
+                ))
+            except ValueError as e:
+                logger.error(f"Signature verification failed for {shard.display_name}: {e}")
+                results[i] = False
+                continue
+            job_indices.append(i)
+        
+        if not jobs:
+            return results
+        
+        workers = min(len(jobs), os.cpu_count() or 1)
+        if workers == 1:
+            _init_signature_worker()
+            verdicts = map(_verify_signature_job, jobs)
+        else:
+            # Never fork: the node runs asyncio loops and threads whose locks
+            # a forked child could inherit mid-acquire
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_signature_worker,
+            ) as pool:
+                verdicts = list(pool.map(_verify_signature_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+        
+        for i, is_valid in zip(job_indices, verdicts):
+            results[i] = is_valid
+            if not is_valid:
+                logger.error(f"✗ PQ signature INVALID for {shards[i].display_name}")
+        
+        logger.info(f"Verified {len(jobs)} shard signatures, {results.count(False)} invalid")
+        return results
+    
     def verify_creator_reputation(
         self,
         shard: MemoryShard,
@@ -560,7 +1189,7 @@ class SynapseNode:
             logger.warning(f"Shard {shard.display_name} has no creator ID")
             return True  # Backward compat
         
-        trust_score = quality_tracker.get_trust_score(shard.creator_agent_id)
+        trust_score = self._get_trust_score(quality_tracker, shard.creator_agent_id)
         is_trusted = trust_score >= min_trust_score
         
         if is_trusted:
@@ -570,6 +1199,33 @@ class SynapseNode:
         
         return is_trusted
     
+    def _get_trust_score(self, quality_tracker, agent_id: str) -> float:
+        """
+        Returns a creator's trust score, cached for TRUST_CACHE_TTL_SECONDS.
+        
+        Bulk verification sees the same creators over and over; this keeps
+        repeat lookups from going back to the quality tracker each time.
+        """
+        now_ns = time.monotonic_ns()
+        cached = self._trust_cache.get(agent_id)
+        if cached is not None:
+            tracker, score, expires_ns = cached
+            if tracker is quality_tracker and now_ns < expires_ns:
+                return score
+        
+        score = quality_tracker.get_trust_score(agent_id)
+        
+        # Re-insert at the tail, then evict from the head to stay within the bound
+        self._trust_cache.pop(agent_id, None)
+        while len(self._trust_cache) >= TRUST_CACHE_MAX_ENTRIES:
+            self._trust_cache.popitem(last=False)
+        self._trust_cache[agent_id] = (
+            quality_tracker,
+            score,
+            now_ns + TRUST_CACHE_TTL_SECONDS * 1_000_000_000,
+        )
+        return score
+    
     def create_quality_attestation(
         self,
         shard: MemoryShard,
@@ -618,31 +1274,34 @@ class SynapseNode:
         if not session:
             return None
         
+        static = session.static_view
         return {
-            "info_hash": session.info_hash,
-            "file_path": session.file_path,
+            "info_hash": static["info_hash"],
+            "file_path": static["file_path"],
             "status": session.status,
             "progress": session.progress,
             "peers": len(session.peers),
             "uploaded": session.uploaded,
             "downloaded": session.downloaded,
             "share_ratio": session.share_ratio,
-            "started_at": session.started_at.isoformat(),
+            "started_at": static["started_at"],
             "completed_at": session.completed_at.isoformat() if session.completed_at else None,
             "error": session.error_message,
         }
     
-    def list_active_sessions(self) -> List[Dict[str, Any]]:
+    def list_active_sessions(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Lists all active download and seed sessions.
         
+        Args:
+            status: Only include sessions in this state (e.g. 'seeding').
+                    Includes every session if None.
+        
         Returns:
             List of session status dictionaries
         """
-        return [
-            self.get_session_status(info_hash)
-            for info_hash in self.sessions.keys()
-        ]
+        info_hashes = self.sessions if status is None else self._status_index.get(status, {})
+        return [self.get_session_status(info_hash) for info_hash in list(info_hashes)]
     
     def stop_session(self, info_hash: str) -> bool:
         """
@@ -677,11 +1336,15 @@ class SynapseNode:
         if not session:
             return False
         
-        if delete_files and Path(session.file_path).exists():
-            Path(session.file_path).unlink()
+        if delete_files:
+            try:
+                os.unlink(session.file_path)
+            except FileNotFoundError:
+                pass
+            self._file_sizes.pop(session.file_path, None)
             logger.info(f"Deleted file: {session.file_path}")
         
-        del self.sessions[info_hash]
+        self._drop_session(session)
         logger.info(f"Removed session: {info_hash}")
         return True
     
@@ -692,10 +1355,10 @@ class SynapseNode:
         Returns:
             Dictionary with network statistics
         """
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = (time.monotonic_ns() - self._start_ns) / 1_000_000_000
         
-        active_downloads = sum(1 for s in self.sessions.values() if s.status == "downloading")
-        active_seeds = sum(1 for s in self.sessions.values() if s.status == "seeding")
+        active_downloads = len(self._status_index.get("downloading", ()))
+        active_seeds = len(self._status_index.get("seeding", ()))
         
         return {
             "node_id": self.node_id,
@@ -705,7 +1368,7 @@ class SynapseNode:
             "active_sessions": len(self.sessions),
             "active_downloads": active_downloads,
             "active_seeds": active_seeds,
-            "known_peers": len(self.dht_routing_table),
+            "known_peers": len(self._dht_peers),
         }
     
     def refresh_dht(self):
@@ -715,10 +1378,121 @@ class SynapseNode:
         Should be called periodically to maintain network connectivity.
         """
         logger.info("Refreshing DHT routing table...")
-        # TODO: Implement DHT refresh logic
-        # - Ping known nodes
-        # - Remove stale entries
-        # - Discover new nodes
+        
+        # Remove stale entries
+        for bucket in self.buckets:
+            if bucket:
+                alive = [peer_id for peer_id in bucket if self._dht_peers[peer_id][1].is_alive()]
+                if len(alive) == len(bucket):
+                    continue
+                for peer_id in set(bucket).difference(alive):
+                    del self._dht_peers[peer_id]
+                bucket[:] = alive
+                self._peer_id_matrix = None
+        
+        # TODO: Ping known nodes and discover new ones
+    
+    def _bucket_index(self, peer_dht_id: bytes) -> Optional[int]:
+        """Returns the k-bucket for a DHT id, or None for our own id."""
+        distance = self._dht_id_int ^ int.from_bytes(peer_dht_id, "big")
+        if distance == 0:
+            return None
+        return distance.bit_length() - 1
+    
+    def add_dht_peer(self, peer: Peer) -> bool:
+        """
+        Inserts or refreshes a peer in the DHT routing table.
+        
+        Follows the Kademlia replacement policy: a full bucket keeps its
+        oldest peer while that peer is still alive, and only evicts it
+        once it has gone stale.
+        
+        Args:
+            peer: Peer to insert (peer_id is mapped with dht_id_from)
+            
+        Returns:
+            True if the peer is in the routing table afterwards
+        """
+        known = self._dht_peers.get(peer.peer_id)
+        peer_dht_id = known[0] if known else dht_id_from(peer.peer_id)
+        index = self._bucket_index(peer_dht_id)
+        if index is None:
+            return False
+        
+        bucket = self.buckets[index]
+        if known:
+            # Move to the tail: most recently seen. The id set is unchanged,
+            # so the cached matrix stays valid (its rows resolve peers by id).
+            bucket.remove(peer.peer_id)
+            bucket.append(peer.peer_id)
+            self._dht_peers[peer.peer_id] = (peer_dht_id, peer)
+            return True
+        
+        if len(bucket) < K_BUCKET_SIZE:
+            bucket.append(peer.peer_id)
+            self._dht_peers[peer.peer_id] = (peer_dht_id, peer)
+            self._peer_id_matrix = None
+            return True
+        
+        oldest_id = bucket[0]
+        if self._dht_peers[oldest_id][1].is_alive():
+            # Keep the long-lived peer; move it to the tail as if it answered a ping
+            bucket.append(bucket.pop(0))
+            return False
+        
+        bucket.pop(0)
+        del self._dht_peers[oldest_id]
+        bucket.append(peer.peer_id)
+        self._dht_peers[peer.peer_id] = (peer_dht_id, peer)
+        self._peer_id_matrix = None
+        return True
+    
+    def closest_peers(self, target: bytes, k: int = K_BUCKET_SIZE) -> List[Peer]:
+        """
+        Returns the k known peers closest to target by XOR distance.
+        
+        Peer ids are packed into an (N, 20) uint8 matrix so the XOR and
+        the big-endian byte-wise sort run as vectorised NumPy operations.
+        
+        Args:
+            target: 20-byte DHT key
+            k: Number of peers to return
+            
+        Returns:
+            Peers ordered from closest to farthest
+            
+        Raises:
+            ValueError: If target is not a DHT_ID_BITS-wide byte string
+        """
+        import numpy as np
+        
+        if not isinstance(target, (bytes, bytearray, memoryview)) or len(target) != DHT_ID_BITS // 8:
+            raise ValueError(f"DHT target must be {DHT_ID_BITS // 8} bytes")
+        
+        if self._peer_id_matrix is None:
+            peer_ids = list(self._dht_peers)
+            ids = b"".join(entry[0] for entry in self._dht_peers.values())
+            matrix = np.frombuffer(ids, dtype=np.uint8).reshape(-1, DHT_ID_BITS // 8)
+            self._peer_id_matrix = (peer_ids, matrix)
+        
+        peer_ids, matrix = self._peer_id_matrix
+        if not peer_ids:
+            return []
+        
+        distances = np.bitwise_xor(matrix, np.frombuffer(target, dtype=np.uint8))
+        # lexsort treats its last key as primary, so feed byte columns reversed
+        order = np.lexsort(distances.T[::-1])[:k]
+        return [self._dht_peers[peer_ids[i]][1] for i in order]
+    
+    def remove_dht_peer(self, peer_id: str) -> bool:
+        """Removes a peer from the DHT routing table."""
+        known = self._dht_peers.pop(peer_id, None)
+        if known is None:
+            return False
+        
+        self.buckets[self._bucket_index(known[0])].remove(peer_id)
+        self._peer_id_matrix = None
+        return True
     
     def shutdown(self):
         """Gracefully shuts down the node."""
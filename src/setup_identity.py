@@ -12,11 +12,25 @@ falls back to Ed25519 for broad compatibility.
 import os
 import sys
 import base64
+import functools
 import hashlib
 import subprocess
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=4096)
+def derive_agent_id(pubkey_bytes: bytes) -> str:
+    """
+    Derive the agent ID for a PEM-encoded public key.
+    
+    The ID is the base32 form of the first 10 bytes of the key's SHA-256
+    digest. Results are cached, so repeated lookups for known creators
+    skip the hash.
+    """
+    pubkey_hash = hashlib.sha256(pubkey_bytes).digest()
+    return base64.b32encode(pubkey_hash[:10]).decode().lower().rstrip("=")
+
+
 def check_openssl_mldsa_support() -> bool:
     """Check if OpenSSL supports ML-DSA-87."""
     try:
@@ -66,8 +80,7 @@ def generate_identity_openssl_mldsa(identity_path: Path) -> dict:
     with open(public_key_path, "rb") as f:
         public_key = f.read()
     
-    pubkey_hash = hashlib.sha256(public_key).digest()
-    agent_id = base64.b32encode(pubkey_hash[:10]).decode().lower().rstrip("=")
+    agent_id = derive_agent_id(public_key)
     
     return {
         "algorithm": "ML-DSA-87",
@@ -118,8 +131,7 @@ def generate_identity_ed25519(identity_path: Path) -> dict:
     os.chmod(public_key_path, 0o644)
     
     # Generate agent ID from public key
-    pubkey_hash = hashlib.sha256(public_pem).digest()
-    agent_id = base64.b32encode(pubkey_hash[:10]).decode().lower().rstrip("=")
+    agent_id = derive_agent_id(public_pem)
     
     return {
         "algorithm": "Ed25519",